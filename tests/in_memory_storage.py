@@ -1,5 +1,7 @@
 from typing import Dict
 
+from typing_extensions import Final
+
 import omemo
 
 
@@ -8,6 +10,10 @@ __all__ = [  # pylint: disable=unused-variable
 ]
 
 
+# Nothing holds no value, thus a single instance can be shared by all lookup misses
+_NOTHING: Final[omemo.Nothing[omemo.JSONType]] = omemo.Nothing()
+
+
 class InMemoryStorage(omemo.Storage):
     """
     Volatile storage implementation with the values held in memory.
@@ -19,10 +25,10 @@ class InMemoryStorage(omemo.Storage):
         self.__storage: Dict[str, omemo.JSONType] = {}
 
     async def _load(self, key: str) -> omemo.Maybe[omemo.JSONType]:
-        try:
+        if key in self.__storage:
             return omemo.Just(self.__storage[key])
-        except KeyError:
-            return omemo.Nothing()
+
+        return _NOTHING
 
     async def _store(self, key: str, value: omemo.JSONType) -> None:
         self.__storage[key] = value
@@ -1,4 +1,4 @@
-from typing import Dict, List, Optional, cast
+from typing import Dict, List, Optional, Tuple, cast
 from xml.etree import ElementTree as ET
 
 import oldmemo
@@ -1397,191 +1397,187 @@ class LegacyStorageImpl(LegacyStorage):
             "version": "0.12.0"
         })
 
-        self.__sessions: Dict[str, Dict[int, Session]] = {
-            BOB_BARE_JID: {
-                543990483: {
+        self.__sessions: Dict[Tuple[str, int], Session] = {
+            (BOB_BARE_JID, 543990483): {
+                "super": {
                     "super": {
-                        "super": {
-                            "super": None,
-                            "root_chain": {
-                                "length": 1,
-                                "key": "qdglSV/R3ClGiEkb604glYv4ZR8KT5JGZ9f4LpVb0f4="
-                            },
-                            "own_key": {
-                                "super": None,
-                                "priv": "QCK8gHnh2NWJPm+CUhY7Rl8eS9YnY8Qh/25XZKhHnnI=",
-                                "pub": "DE332GI542wqdG/qMs0dnwU9GZGdHql9KeogAnnqCVg="
-                            },
-                            "other_pub": {
-                                "super": None,
-                                "priv": None,
-                                "pub": "s5YiNlC8TML3n3U01WQzqmyznud++YpAsTqaPxEohyk="
-                            }
-                        },
-                        "skr": {
-                            "super": None,
-                            "schain": {
-                                "length": 1,
-                                "key": "mWdtSXtFv+Bmt0SiJjhs+dX302KIJfp14Kfmhi9iXDE="
-                            },
-                            "rchain": None,
-                            "prev_schain_length": None
-                        },
-                        "ad":
-                            "BaB8h0TC71J7q1nZtVdZf3psiYJHEdMyVhwHsLbZWRRiBV9fZvG3d9VDGN5YesFEza85kVg1fghRgw2V"
-                            "ufMB1Dov",
-                        "smks": {}
+                        "super": None,
+                        "root_chain": {
+                            "length": 1,
+                            "key": "qdglSV/R3ClGiEkb604glYv4ZR8KT5JGZ9f4LpVb0f4="
+                        },
+                        "own_key": {
+                            "super": None,
+                            "priv": "QCK8gHnh2NWJPm+CUhY7Rl8eS9YnY8Qh/25XZKhHnnI=",
+                            "pub": "DE332GI542wqdG/qMs0dnwU9GZGdHql9KeogAnnqCVg="
+                        },
+                        "other_pub": {
+                            "super": None,
+                            "priv": None,
+                            "pub": "s5YiNlC8TML3n3U01WQzqmyznud++YpAsTqaPxEohyk="
+                        }
                     },
-                    "other_ik": "X19m8bd31UMY3lh6wUTNrzmRWDV+CFGDDZW58wHUOi8="
+                    "skr": {
+                        "super": None,
+                        "schain": {
+                            "length": 1,
+                            "key": "mWdtSXtFv+Bmt0SiJjhs+dX302KIJfp14Kfmhi9iXDE="
+                        },
+                        "rchain": None,
+                        "prev_schain_length": None
+                    },
+                    "ad":
+                        "BaB8h0TC71J7q1nZtVdZf3psiYJHEdMyVhwHsLbZWRRiBV9fZvG3d9VDGN5YesFEza85kVg1fghRgw2V"
+                        "ufMB1Dov",
+                    "smks": {}
                 },
-                1746810996: {
+                "other_ik": "X19m8bd31UMY3lh6wUTNrzmRWDV+CFGDDZW58wHUOi8="
+            },
+            (BOB_BARE_JID, 1746810996): {
+                "super": {
                     "super": {
-                        "super": {
-                            "super": None,
-                            "root_chain": {
-                                "length": 1,
-                                "key": "R++74Y8wNT+cXFyb4Q9Xf9PnBDUxXi2yynKyyVNurgM="
-                            },
-                            "own_key": {
-                                "super": None,
-                                "priv": "cEaaTCUUBjLyGJ8WngxV8Kjy3DCzl/j6nTP8G/NZiGk=",
-                                "pub": "pWhLUikIlfdIlVRM6J9y3oj7z7LoV929OS4D1dL+ZnY="
-                            },
-                            "other_pub": {
-                                "super": None,
-                                "priv": None,
-                                "pub": "IipARZXB273UAIKimuZsKVh6jF73zRswAtEukymlWEw="
-                            }
-                        },
-                        "skr": {
-                            "super": None,
-                            "schain": {
-                                "length": 1,
-                                "key": "MAy5SWE3pJfaq63IttPWLsaXrfKR1a8NhFfbxKvDP4M="
-                            },
-                            "rchain": None,
-                            "prev_schain_length": None
-                        },
-                        "ad":
-                            "BaB8h0TC71J7q1nZtVdZf3psiYJHEdMyVhwHsLbZWRRiBepHj/wMBKXWRnyQLMXRwi104ezCRwf/Cx5G"
-                            "HVowxNsr",
-                        "smks": {}
+                        "super": None,
+                        "root_chain": {
+                            "length": 1,
+                            "key": "R++74Y8wNT+cXFyb4Q9Xf9PnBDUxXi2yynKyyVNurgM="
+                        },
+                        "own_key": {
+                            "super": None,
+                            "priv": "cEaaTCUUBjLyGJ8WngxV8Kjy3DCzl/j6nTP8G/NZiGk=",
+                            "pub": "pWhLUikIlfdIlVRM6J9y3oj7z7LoV929OS4D1dL+ZnY="
+                        },
+                        "other_pub": {
+                            "super": None,
+                            "priv": None,
+                            "pub": "IipARZXB273UAIKimuZsKVh6jF73zRswAtEukymlWEw="
+                        }
                     },
-                    "other_ik": "6keP/AwEpdZGfJAsxdHCLXTh7MJHB/8LHkYdWjDE2ys="
+                    "skr": {
+                        "super": None,
+                        "schain": {
+                            "length": 1,
+                            "key": "MAy5SWE3pJfaq63IttPWLsaXrfKR1a8NhFfbxKvDP4M="
+                        },
+                        "rchain": None,
+                        "prev_schain_length": None
+                    },
+                    "ad":
+                        "BaB8h0TC71J7q1nZtVdZf3psiYJHEdMyVhwHsLbZWRRiBepHj/wMBKXWRnyQLMXRwi104ezCRwf/Cx5G"
+                        "HVowxNsr",
+                    "smks": {}
                 },
-                254614318: {
+                "other_ik": "6keP/AwEpdZGfJAsxdHCLXTh7MJHB/8LHkYdWjDE2ys="
+            },
+            (BOB_BARE_JID, 254614318): {
+                "super": {
                     "super": {
-                        "super": {
-                            "super": None,
-                            "root_chain": {
-                                "length": 3,
-                                "key": "B/loxMpW9NmrR7nmZOHbIbYVBBE/wA3+Ywd7zi2Rul0="
-                            },
-                            "own_key": {
-                                "super": None,
-                                "priv": "+P1pJdpLx7V9SLVSI/mR+WdDsa8doFRmWBmhbqk073s=",
-                                "pub": "YvRzvBBEo8VpDPE1pyiHhx5eonTtIfwUp/egMuKkeC0="
-                            },
-                            "other_pub": {
-                                "super": None,
-                                "priv": None,
-                                "pub": "kGMSCOcW8fI5Jpqi86PYyytw+JDE96pEjQOrLODTkXU="
-                            }
-                        },
-                        "skr": {
-                            "super": None,
-                            "schain": {
-                                "length": 0,
-                                "key": "1qHExVTPmWhXXgZR5x2ZF6mYUZ/QB6/Bpv3lGmWsRiU="
-                            },
-                            "rchain": {
-                                "length": 2,
-                                "key": "izfEzNI8NC13k3UJVq8dM4d2hys4OTiTTXlYVfJi8Vo="
-                            },
-                            "prev_schain_length": 1
-                        },
-                        "ad":
-                            "BaB8h0TC71J7q1nZtVdZf3psiYJHEdMyVhwHsLbZWRRiBc84+UOQFYdS1NbOEsA2Qu3UqAqMmJpjAgg0"
-                            "4YfdoVdA",
-                        "smks": {}
+                        "super": None,
+                        "root_chain": {
+                            "length": 3,
+                            "key": "B/loxMpW9NmrR7nmZOHbIbYVBBE/wA3+Ywd7zi2Rul0="
+                        },
+                        "own_key": {
+                            "super": None,
+                            "priv": "+P1pJdpLx7V9SLVSI/mR+WdDsa8doFRmWBmhbqk073s=",
+                            "pub": "YvRzvBBEo8VpDPE1pyiHhx5eonTtIfwUp/egMuKkeC0="
+                        },
+                        "other_pub": {
+                            "super": None,
+                            "priv": None,
+                            "pub": "kGMSCOcW8fI5Jpqi86PYyytw+JDE96pEjQOrLODTkXU="
+                        }
                     },
-                    "other_ik": "zzj5Q5AVh1LU1s4SwDZC7dSoCoyYmmMCCDThh92hV0A="
-                }
+                    "skr": {
+                        "super": None,
+                        "schain": {
+                            "length": 0,
+                            "key": "1qHExVTPmWhXXgZR5x2ZF6mYUZ/QB6/Bpv3lGmWsRiU="
+                        },
+                        "rchain": {
+                            "length": 2,
+                            "key": "izfEzNI8NC13k3UJVq8dM4d2hys4OTiTTXlYVfJi8Vo="
+                        },
+                        "prev_schain_length": 1
+                    },
+                    "ad":
+                        "BaB8h0TC71J7q1nZtVdZf3psiYJHEdMyVhwHsLbZWRRiBc84+UOQFYdS1NbOEsA2Qu3UqAqMmJpjAgg0"
+                        "4YfdoVdA",
+                    "smks": {}
+                },
+                "other_ik": "zzj5Q5AVh1LU1s4SwDZC7dSoCoyYmmMCCDThh92hV0A="
             },
-            ALICE_BARE_JID: {
-                1640101268: {
+            (ALICE_BARE_JID, 1640101268): {
+                "super": {
                     "super": {
-                        "super": {
-                            "super": None,
-                            "root_chain": {
-                                "length": 3,
-                                "key": "VBc6DEauqdg3Rms0FrxXnYqXN+rJzYTBnF3bBtNQgNI="
-                            },
-                            "own_key": {
-                                "super": None,
-                                "priv": "qHZ3vHoGOYOSb4mA7SNdakPr4tPzavz3tDVUlJbl8Fc=",
-                                "pub": "6hx93vhdZ5SU4dmn2/Vv6HZq7NQEukS18RXbgbpAanM="
-                            },
-                            "other_pub": {
-                                "super": None,
-                                "priv": None,
-                                "pub": "ziV5pboN/FJDKd4CVAM5WZPoJ2piYPo2pVAHmy4cHS0="
-                            }
-                        },
-                        "skr": {
-                            "super": None,
-                            "schain": {
-                                "length": 0,
-                                "key": "jtFIKe/WW151OqzCStFc4X12KU4Oh67LDukv3pOZRIg="
-                            },
-                            "rchain": {
-                                "length": 1,
-                                "key": "VjHTeYrE/udbYy6z3EphvL4gkxPzHfyIOAeA5DsNbSE="
-                            },
-                            "prev_schain_length": 1
-                        },
-                        "ad":
-                            "BaB8h0TC71J7q1nZtVdZf3psiYJHEdMyVhwHsLbZWRRiBde4XMA5ywmeeVb3ZiNPHvbAoEAwDEz+y/P/"
-                            "hA+3o+8N",
-                        "smks": {}
+                        "super": None,
+                        "root_chain": {
+                            "length": 3,
+                            "key": "VBc6DEauqdg3Rms0FrxXnYqXN+rJzYTBnF3bBtNQgNI="
+                        },
+                        "own_key": {
+                            "super": None,
+                            "priv": "qHZ3vHoGOYOSb4mA7SNdakPr4tPzavz3tDVUlJbl8Fc=",
+                            "pub": "6hx93vhdZ5SU4dmn2/Vv6HZq7NQEukS18RXbgbpAanM="
+                        },
+                        "other_pub": {
+                            "super": None,
+                            "priv": None,
+                            "pub": "ziV5pboN/FJDKd4CVAM5WZPoJ2piYPo2pVAHmy4cHS0="
+                        }
                     },
-                    "other_ik": "17hcwDnLCZ55VvdmI08e9sCgQDAMTP7L8/+ED7ej7w0="
+                    "skr": {
+                        "super": None,
+                        "schain": {
+                            "length": 0,
+                            "key": "jtFIKe/WW151OqzCStFc4X12KU4Oh67LDukv3pOZRIg="
+                        },
+                        "rchain": {
+                            "length": 1,
+                            "key": "VjHTeYrE/udbYy6z3EphvL4gkxPzHfyIOAeA5DsNbSE="
+                        },
+                        "prev_schain_length": 1
+                    },
+                    "ad":
+                        "BaB8h0TC71J7q1nZtVdZf3psiYJHEdMyVhwHsLbZWRRiBde4XMA5ywmeeVb3ZiNPHvbAoEAwDEz+y/P/"
+                        "hA+3o+8N",
+                    "smks": {}
                 },
-                1895030716: {
+                "other_ik": "17hcwDnLCZ55VvdmI08e9sCgQDAMTP7L8/+ED7ej7w0="
+            },
+            (ALICE_BARE_JID, 1895030716): {
+                "super": {
                     "super": {
-                        "super": {
-                            "super": None,
-                            "root_chain": {
-                                "length": 1,
-                                "key": "+ZheXMs4YUirbou3sdBh5rBg8RsVunOJrSxmB4Ynvq4="
-                            },
-                            "own_key": {
-                                "super": None,
-                                "priv": "qBB/eunKyXjGW/RpH31oABtMNDynnpsYfu6egBN68Vg=",
-                                "pub": "nbbbWUdYEN8YogMd8FKDZ+qlz2jAk7V0UuSm6e6gTxY="
-                            },
-                            "other_pub": {
-                                "super": None,
-                                "priv": None,
-                                "pub": "i+VxR79cLM09i2KlKGBEUFDdK6UrrnMVE58J+BgMeSs="
-                            }
-                        },
-                        "skr": {
-                            "super": None,
-                            "schain": {
-                                "length": 1,
-                                "key": "14XDd+3FyhkS0jSfYtYDIYVX0a+//3V/VcZd07yqd28="
-                            },
-                            "rchain": None,
-                            "prev_schain_length": None
-                        },
-                        "ad":
-                            "BaB8h0TC71J7q1nZtVdZf3psiYJHEdMyVhwHsLbZWRRiBea/qneH5GO9JWV486GPweRyxSrykVOK5AAt"
-                            "Sl7PC4EC",
-                        "smks": {}
+                        "super": None,
+                        "root_chain": {
+                            "length": 1,
+                            "key": "+ZheXMs4YUirbou3sdBh5rBg8RsVunOJrSxmB4Ynvq4="
+                        },
+                        "own_key": {
+                            "super": None,
+                            "priv": "qBB/eunKyXjGW/RpH31oABtMNDynnpsYfu6egBN68Vg=",
+                            "pub": "nbbbWUdYEN8YogMd8FKDZ+qlz2jAk7V0UuSm6e6gTxY="
+                        },
+                        "other_pub": {
+                            "super": None,
+                            "priv": None,
+                            "pub": "i+VxR79cLM09i2KlKGBEUFDdK6UrrnMVE58J+BgMeSs="
+                        }
                     },
-                    "other_ik": "5r+qd4fkY70lZXjzoY/B5HLFKvKRU4rkAC1KXs8LgQI="
-                }
+                    "skr": {
+                        "super": None,
+                        "schain": {
+                            "length": 1,
+                            "key": "14XDd+3FyhkS0jSfYtYDIYVX0a+//3V/VcZd07yqd28="
+                        },
+                        "rchain": None,
+                        "prev_schain_length": None
+                    },
+                    "ad":
+                        "BaB8h0TC71J7q1nZtVdZf3psiYJHEdMyVhwHsLbZWRRiBea/qneH5GO9JWV486GPweRyxSrykVOK5AAt"
+                        "Sl7PC4EC",
+                    "smks": {}
+                },
+                "other_ik": "5r+qd4fkY70lZXjzoY/B5HLFKvKRU4rkAC1KXs8LgQI="
             }
         }
 
@@ -1595,30 +1591,26 @@ class LegacyStorageImpl(LegacyStorage):
             ALICE_BARE_JID: {}
         }
 
-        self.__trust: Dict[str, Dict[int, Trust]] = {
-            BOB_BARE_JID: {
-                543990483: {
-                    "key": "X19m8bd31UMY3lh6wUTNrzmRWDV+CFGDDZW58wHUOi8=",
-                    "trusted": True
-                },
-                1746810996: {
-                    "key": "6keP/AwEpdZGfJAsxdHCLXTh7MJHB/8LHkYdWjDE2ys=",
-                    "trusted": True
-                },
-                254614318: {
-                    "key": "zzj5Q5AVh1LU1s4SwDZC7dSoCoyYmmMCCDThh92hV0A=",
-                    "trusted": True
-                }
+        self.__trust: Dict[Tuple[str, int], Trust] = {
+            (BOB_BARE_JID, 543990483): {
+                "key": "X19m8bd31UMY3lh6wUTNrzmRWDV+CFGDDZW58wHUOi8=",
+                "trusted": True
             },
-            ALICE_BARE_JID: {
-                1895030716: {
-                    "key": "5r+qd4fkY70lZXjzoY/B5HLFKvKRU4rkAC1KXs8LgQI=",
-                    "trusted": True
-                },
-                1640101268: {
-                    "key": "17hcwDnLCZ55VvdmI08e9sCgQDAMTP7L8/+ED7ej7w0=",
-                    "trusted": True
-                }
+            (BOB_BARE_JID, 1746810996): {
+                "key": "6keP/AwEpdZGfJAsxdHCLXTh7MJHB/8LHkYdWjDE2ys=",
+                "trusted": True
+            },
+            (BOB_BARE_JID, 254614318): {
+                "key": "zzj5Q5AVh1LU1s4SwDZC7dSoCoyYmmMCCDThh92hV0A=",
+                "trusted": True
+            },
+            (ALICE_BARE_JID, 1895030716): {
+                "key": "5r+qd4fkY70lZXjzoY/B5HLFKvKRU4rkAC1KXs8LgQI=",
+                "trusted": True
+            },
+            (ALICE_BARE_JID, 1640101268): {
+                "key": "17hcwDnLCZ55VvdmI08e9sCgQDAMTP7L8/+ED7ej7w0=",
+                "trusted": True
             }
         }
 
@@ -1637,10 +1629,10 @@ class LegacyStorageImpl(LegacyStorage):
         self.__state = None
 
     async def loadSession(self, bare_jid: str, device_id: int) -> Optional[Session]:
-        return self.__sessions.get(bare_jid, {}).get(device_id, None)
+        return self.__sessions.get((bare_jid, device_id), None)
 
     async def deleteSession(self, bare_jid: str, device_id: int) -> None:
-        self.__sessions.get(bare_jid, {}).pop(device_id, None)
+        self.__sessions.pop((bare_jid, device_id), None)
 
     async def loadActiveDevices(self, bare_jid: str) -> Optional[List[int]]:
         return self.__active_devices.get(bare_jid, None)
@@ -1655,10 +1647,10 @@ class LegacyStorageImpl(LegacyStorage):
         self.__inactive_devices.pop(bare_jid, None)
 
     async def loadTrust(self, bare_jid: str, device_id: int) -> Optional[Trust]:
-        return self.__trust.get(bare_jid, {}).get(device_id, None)
+        return self.__trust.get((bare_jid, device_id), None)
 
     async def deleteTrust(self, bare_jid: str, device_id: int) -> None:
-        self.__trust.get(bare_jid, {}).pop(device_id, None)
+        self.__trust.pop((bare_jid, device_id), None)
 
     async def listJIDs(self) -> Optional[List[str]]:
         return self.__jid_list
@@ -1,7 +1,7 @@
 import enum
 from typing import Dict, FrozenSet, List, Optional, Tuple, Type
 
-from typing_extensions import NamedTuple, assert_never
+from typing_extensions import Final, NamedTuple
 
 import omemo
 
@@ -28,6 +28,13 @@ class TrustLevel(enum.Enum):
     DISTRUSTED: str = "DISTRUSTED"
 
 
+_TRUST_LEVEL_MAPPING: Final[Dict[str, omemo.TrustLevel]] = {
+    TrustLevel.TRUSTED.value: omemo.TrustLevel.TRUSTED,
+    TrustLevel.UNDECIDED.value: omemo.TrustLevel.UNDECIDED,
+    TrustLevel.DISTRUSTED.value: omemo.TrustLevel.DISTRUSTED
+}
+
+
 class BundleStorageKey(NamedTuple):
     # pylint: disable=invalid-name
     """
@@ -78,66 +85,39 @@ def make_session_manager_impl(
         # pylint: disable=missing-class-docstring
         @staticmethod
         async def _upload_bundle(bundle: omemo.Bundle) -> None:
-            bundle_storage[BundleStorageKey(
-                namespace=bundle.namespace,
-                bare_jid=bundle.bare_jid,
-                device_id=bundle.device_id
-            )] = bundle
+            bundle_storage[BundleStorageKey(bundle.namespace, bundle.bare_jid, bundle.device_id)] = bundle
 
         @staticmethod
         async def _download_bundle(namespace: str, bare_jid: str, device_id: int) -> omemo.Bundle:
             try:
-                return bundle_storage[BundleStorageKey(
-                    namespace=namespace,
-                    bare_jid=bare_jid,
-                    device_id=device_id
-                )]
+                return bundle_storage[BundleStorageKey(namespace, bare_jid, device_id)]
             except KeyError as e:
                 raise omemo.BundleDownloadFailed() from e
 
         @staticmethod
         async def _delete_bundle(namespace: str, device_id: int) -> None:
             try:
-                bundle_storage.pop(BundleStorageKey(
-                    namespace=namespace,
-                    bare_jid=own_bare_jid,
-                    device_id=device_id
-                ))
+                bundle_storage.pop(BundleStorageKey(namespace, own_bare_jid, device_id))
             except KeyError as e:
                 raise omemo.BundleDeletionFailed() from e
 
         @staticmethod
         async def _upload_device_list(namespace: str, device_list: Dict[int, Optional[str]]) -> None:
-            device_list_storage[DeviceListStorageKey(
-                namespace=namespace,
-                bare_jid=own_bare_jid
-            )] = device_list
+            device_list_storage[DeviceListStorageKey(namespace, own_bare_jid)] = device_list
 
         @staticmethod
         async def _download_device_list(namespace: str, bare_jid: str) -> Dict[int, Optional[str]]:
             try:
-                return device_list_storage[DeviceListStorageKey(
-                    namespace=namespace,
-                    bare_jid=bare_jid
-                )]
+                return device_list_storage[DeviceListStorageKey(namespace, bare_jid)]
             except KeyError:
                 return {}
 
         async def _evaluate_custom_trust_level(self, device: omemo.DeviceInformation) -> omemo.TrustLevel:
             try:
-                trust_level = TrustLevel(device.trust_level_name)
-            except ValueError as e:
+                return _TRUST_LEVEL_MAPPING[device.trust_level_name]
+            except KeyError as e:
                 raise omemo.UnknownTrustLevel() from e
 
-            if trust_level is TrustLevel.TRUSTED:
-                return omemo.TrustLevel.TRUSTED
-            if trust_level is TrustLevel.UNDECIDED:
-                return omemo.TrustLevel.UNDECIDED
-            if trust_level is TrustLevel.DISTRUSTED:
-                return omemo.TrustLevel.DISTRUSTED
-
-            assert_never(trust_level)
-
         async def _make_trust_decision(
             self,
             undecided: FrozenSet[omemo.DeviceInformation],
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Awaitable, Callable, Dict
 import xml.etree.ElementTree as ET
 
 import oldmemo
@@ -7,6 +7,9 @@ from oldmemo.migrations import migrate
 import twomemo
 import twomemo.etree
 import pytest
+from typing_extensions import Final
+
+import omemo
 
 from .data import NS_TWOMEMO, NS_OLDMEMO, ALICE_BARE_JID, BOB_BARE_JID
 from .in_memory_storage import InMemoryStorage
@@ -24,6 +27,37 @@ __all__ = [  # pylint: disable=unused-variable
 pytestmark = pytest.mark.asyncio  # pylint: disable=unused-variable
 
 
+_ONLY_ALICE: Final = frozenset({ ALICE_BARE_JID })
+_ONLY_BOB: Final = frozenset({ BOB_BARE_JID })
+
+_MessageParser = Callable[[ET.Element, str, str, omemo.SessionManager], Awaitable[omemo.Message]]
+
+
+async def _parse_twomemo_message(
+    element: ET.Element,
+    sender_bare_jid: str,
+    own_bare_jid: str,
+    session_manager: omemo.SessionManager
+) -> omemo.Message:
+    # pylint: disable=unused-argument
+    """
+    Adapter giving :func:`twomemo.etree.parse_message` the signature of :func:`oldmemo.etree.parse_message`.
+    """
+
+    return twomemo.etree.parse_message(element, sender_bare_jid)
+
+
+_SERIALIZERS: Final[Dict[str, Callable[[omemo.Message], ET.Element]]] = {
+    NS_TWOMEMO: twomemo.etree.serialize_message,
+    NS_OLDMEMO: oldmemo.etree.serialize_message
+}
+
+_PARSERS: Final[Dict[str, _MessageParser]] = {
+    NS_TWOMEMO: _parse_twomemo_message,
+    NS_OLDMEMO: oldmemo.etree.parse_message
+}
+
+
 async def test_regression0() -> None:
     """
     Test a specific scenario that caused trouble during Libervia's JET plugin implementation.
@@ -83,7 +117,7 @@ async def test_regression0() -> None:
     # Have Alice encrypt an initial message to Bob to set up sessions between them
     for namespace in [ NS_TWOMEMO, NS_OLDMEMO ]:
         messages, encryption_errors = await alice_session_manager.encrypt(
-            bare_jids=frozenset({ BOB_BARE_JID }),
+            bare_jids=_ONLY_BOB,
             plaintext={ namespace: b"Hello, Bob!" },
             backend_priority_order=[ namespace ]
         )
@@ -92,7 +126,7 @@ async def test_regression0() -> None:
         assert len(encryption_errors) == 0
 
         # Have Bob decrypt the message
-        message = next(iter(messages.keys()))
+        (message,) = messages
 
         plaintext, _, _ = await bob_session_manager.decrypt(message)
         assert plaintext == b"Hello, Bob!"
@@ -111,7 +145,7 @@ async def test_regression0() -> None:
     # removed from the serialized XML. This test tests that scenario with both twomemo and oldmemo.
     for namespace in [ NS_TWOMEMO, NS_OLDMEMO ]:
         messages, encryption_errors = await alice_session_manager.encrypt(
-            bare_jids=frozenset({ BOB_BARE_JID }),
+            bare_jids=_ONLY_BOB,
             plaintext={ namespace: b"\x00" * 32 },
             backend_priority_order=[ namespace ]
         )
@@ -119,28 +153,15 @@ async def test_regression0() -> None:
         assert len(messages) == 1
         assert len(encryption_errors) == 0
 
-        message = next(iter(messages.keys()))
+        (message,) = messages
 
         # Serialize the message to XML, remove the payload, and parse it again
-        encrypted_elt: Optional[ET.Element] = None
-        if namespace == NS_TWOMEMO:
-            encrypted_elt = twomemo.etree.serialize_message(message)
-        if namespace == NS_OLDMEMO:
-            encrypted_elt = oldmemo.etree.serialize_message(message)
-        assert encrypted_elt is not None
+        encrypted_elt = _SERIALIZERS[namespace](message)
 
         for payload_elt in encrypted_elt.findall(f"{{{namespace}}}payload"):
             encrypted_elt.remove(payload_elt)
 
-        if namespace == NS_TWOMEMO:
-            message = twomemo.etree.parse_message(encrypted_elt, ALICE_BARE_JID)
-        if namespace == NS_OLDMEMO:
-            message = await oldmemo.etree.parse_message(
-                encrypted_elt,
-                ALICE_BARE_JID,
-                BOB_BARE_JID,
-                bob_session_manager
-            )
+        message = await _PARSERS[namespace](encrypted_elt, ALICE_BARE_JID, BOB_BARE_JID, bob_session_manager)
 
         # Decrypt the message on Bob's side
         plaintext, _, _ = await bob_session_manager.decrypt(message)
@@ -149,23 +170,25 @@ async def test_regression0() -> None:
     # At this point, communication between both parties was broken. Try to send two messages back and forth.
     for namespace in [ NS_TWOMEMO, NS_OLDMEMO ]:
         messages, encryption_errors = await alice_session_manager.encrypt(
-            bare_jids=frozenset({ BOB_BARE_JID }),
+            bare_jids=_ONLY_BOB,
             plaintext={ namespace: b"Hello again, Bob!" },
             backend_priority_order=[ namespace ]
         )
         assert len(messages) == 1
         assert len(encryption_errors) == 0
-        plaintext, _, _ = await bob_session_manager.decrypt(next(iter(messages.keys())))
+        (message,) = messages
+        plaintext, _, _ = await bob_session_manager.decrypt(message)
         assert plaintext == b"Hello again, Bob!"
 
         messages, encryption_errors = await bob_session_manager.encrypt(
-            bare_jids=frozenset({ ALICE_BARE_JID }),
+            bare_jids=_ONLY_ALICE,
             plaintext={ namespace: b"Hello back, Alice!" },
             backend_priority_order=[ namespace ]
         )
         assert len(messages) == 1
         assert len(encryption_errors) == 0
-        plaintext, _, _ = await alice_session_manager.decrypt(next(iter(messages.keys())))
+        (message,) = messages
+        plaintext, _, _ = await alice_session_manager.decrypt(message)
         assert plaintext == b"Hello back, Alice!"
 
 